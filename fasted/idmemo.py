@@ -1,44 +1,102 @@
-from typing import Any, Generic
+import warnings
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar, overload
 
 from .typing import TResult as TMemo
 
+TDefault = TypeVar("TDefault")
+
+_MISSING: Any = object()
+"""Sentinel for missing memo values."""
+
 
 class IdMemo(Generic[TMemo]):
-    """Simple memo class that uses `id()` for hash calculation."""
+    """
+    Simple, size-limited LRU memo class that uses `id()` for key calculation.
+
+    The memo can be used from multiple threads: a value that is evicted by a concurrent
+    `store()` is treated as a miss.
+
+    Keys are compared for equality, so using the tuple of the relevant `id()` values as the key
+    is collision-free as long as the identified objects are alive.
+    """
+
+    __slots__ = ("_cache", "_maxsize")
+
+    def __init__(self, maxsize: int = 32) -> None:
+        """
+        Initialization.
+
+        Arguments:
+            maxsize: The maximum number of values to keep in the memo.
+        """
+        self._cache: OrderedDict[Hashable, TMemo] = OrderedDict()
+        self._maxsize = maxsize
 
-    __slots__ = ("_hash", "_value")
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._cache
 
-    def __init__(self) -> None:
-        """Initialization."""
-        self._hash: int | None = None
-        self._value: TMemo | None = None
+    @overload
+    def get(self, key: Hashable) -> TMemo | None: ...
 
-    def __contains__(self, key: int) -> bool:
-        return self._hash == key
+    @overload
+    def get(self, key: Hashable, default: TDefault) -> TMemo | TDefault: ...
 
-    @property
-    def value(self) -> TMemo:
-        """The current value in the memo."""
-        if self._value is None:
-            raise KeyError("Memo value accessed before first use.")
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value that is stored for the given key, or `default` if the key is not in the memo.
+
+        Arguments:
+            key: The calculated key of the value to look up.
+            default: The value to return if the key is not in the memo.
+        """
+        cache = self._cache
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+
+        try:
+            cache.move_to_end(key)
+        except KeyError:
+            # Evicted by a concurrent store(), treat it as a miss.
+            return default
 
-        return self._value
+        return value
 
-    def store(self, key: int, value: TMemo) -> TMemo:
+    def store(self, key: Hashable, value: TMemo) -> TMemo:
         """
-        Stores the given value in the memo.
+        Stores the given value in the memo, evicting the least recently used value if necessary.
 
         Arguments:
-            key: The calculated key (hash) for the given `value`.
+            key: The calculated key for the given `value`.
             value: The value to store in the memo.
 
         Returns:
             The received `value`.
         """
-        self._hash = key
-        self._value = value
+        cache = self._cache
+        cache[key] = value
+        try:
+            cache.move_to_end(key)
+            while len(cache) > self._maxsize:
+                cache.popitem(last=False)
+        except KeyError:
+            # A concurrent store() evicted the key or emptied the memo first.
+            pass
+
         return value
 
     def hash(self, *items: Any) -> int:
-        """Calculates the hash of the positional arguments using the `id()` function."""
+        """
+        Calculates the hash of the positional arguments using the `id()` function.
+
+        Deprecated: hashes can collide, so the result must not be used as a memo key.
+        Use the tuple of the `id()` values as the key instead.
+        """
+        warnings.warn(
+            "IdMemo.hash() is deprecated, use the tuple of the id() values as the key instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return hash(tuple(id(i) for i in items))
@@ -1,134 +1,191 @@
+from __future__ import annotations
+
 import asyncio
 import inspect
-from collections.abc import AsyncGenerator, Callable, Generator
-from functools import wraps
-from typing import Annotated, Any, Concatenate, Coroutine, Generic, overload
+from functools import partial
+from typing import TYPE_CHECKING, Annotated, Generic, overload
 
 from fastapi import Depends
 
 from .idmemo import IdMemo
-from .typing import BoundMethod, Dependency, TOwner, TParams, TResult
-from .utils import replace_self_signature
+from .typing import TOwner, TParams, TResult
+from .utils import get_self_signature, is_dependency_annotation
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Generator
+    from typing import Any, Concatenate, Coroutine
 
-class SelfWrapper:
+    from .typing import BoundMethod, Dependency, TWrapper
+
+
+def _copy_meta(wrapper: TWrapper, func: Callable[..., Any]) -> TWrapper:
     """
-    `SelfDependent` function wrappers that populate the `self` argument of the wrapped function
-    from the keyword arguments (if one was provided), or use the owner instance if one wasn't
-    provided. Thus the wrapped "static" methods can behave as if they were instance methods.
+    Lightweight alternative to `functools.update_wrapper()` that only copies the metadata
+    that FastAPI relies on.
+
+    Arguments:
+        wrapper: The wrapper function.
+        func: The wrapped function.
+
+    Returns:
+        The received wrapper.
     """
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    return wrapper
 
-    @classmethod
-    def sync_method(
-        cls,
-        func: Callable[Concatenate[TOwner, TParams], TResult],
-        owner: TOwner | None,
-    ) -> Callable[TParams, TResult]:
-        """
-        Wrapper for synchronous methods.
 
-        Arguments:
-            func: The function to wrap.
-            owner: An optional owner object.
+def _bind_owner(
+    func: Callable[Concatenate[TOwner, TParams], TResult],
+    owner: TOwner,
+) -> Callable[TParams, TResult]:
+    """
+    Binds `owner` as the `self` argument of `func`.
 
-        Returns:
-            The wrapper.
-        """
+    Arguments:
+        func: The function to bind.
+        owner: The owner object.
 
-        @wraps(func)
-        def do(*args: TParams.args, **kwargs: TParams.kwargs) -> TResult:
-            func_self: TOwner = kwargs.pop("self") if "self" in kwargs else owner  # type: ignore[assignment]
-            if func_self is None:
-                raise RuntimeError("Missing self argument.")
+    Returns:
+        A `functools.partial` with the metadata of `func`.
+    """
+    return _copy_meta(partial(func, owner), func)
 
-            return func(func_self, *args, **kwargs)
 
-        return do
+def _wrap_sync_method(
+    func: Callable[Concatenate[TOwner, TParams], TResult],
+    owner: TOwner | None,
+) -> Callable[TParams, TResult]:
+    """
+    Wrapper for synchronous methods.
 
-    @classmethod
-    def sync_generator(
-        cls,
-        func: Callable[Concatenate[TOwner, TParams], Generator[TResult, Any, Any]],
-        owner: TOwner | None,
-    ) -> Callable[TParams, Generator[TResult, None, None]]:
-        """
-        Wrapper for synchronous generator methods.
+    Arguments:
+        func: The function to wrap.
+        owner: An optional owner object.
 
-        Arguments:
-            func: The function to wrap.
-            owner: An optional owner object.
+    Returns:
+        The wrapper.
+    """
+    if owner is not None:
+        return _bind_owner(func, owner)
 
-        Returns:
-            The wrapper.
-        """
+    def do(*args: TParams.args, **kwargs: TParams.kwargs) -> TResult:
+        func_self: TOwner | None = kwargs.pop("self", None)  # type: ignore[assignment]
+        if func_self is None:
+            raise RuntimeError("Missing self argument.")
 
-        @wraps(func)
-        def do(*args: TParams.args, **kwargs: TParams.kwargs) -> Generator[TResult, None, None]:
-            func_self: TOwner = kwargs.pop("self") if "self" in kwargs else owner  # type: ignore[assignment]
-            if func_self is None:
-                raise RuntimeError("Missing self argument.")
+        return func(func_self, *args, **kwargs)
 
-            yield from func(func_self, *args, **kwargs)
+    return _copy_meta(do, func)
 
-        return do
 
-    @classmethod
-    def async_method(
-        cls,
-        func: Callable[Concatenate[TOwner, TParams], Coroutine[None, None, TResult]],
-        owner: TOwner | None,
-    ) -> Callable[TParams, Coroutine[None, None, TResult]]:
-        """
-        Wrapper for asynchronous methods.
+def _wrap_sync_generator(
+    func: Callable[Concatenate[TOwner, TParams], Generator[TResult, Any, Any]],
+    owner: TOwner | None,
+) -> Callable[TParams, Generator[TResult, None, None]]:
+    """
+    Wrapper for synchronous generator methods.
 
-        Arguments:
-            func: The function to wrap.
-            owner: An optional owner object.
+    Arguments:
+        func: The function to wrap.
+        owner: An optional owner object.
 
-        Returns:
-            The wrapper.
-        """
+    Returns:
+        The wrapper.
+    """
+    if owner is not None:
+        return _bind_owner(func, owner)
 
-        @wraps(func)
-        async def do(*args: TParams.args, **kwargs: TParams.kwargs) -> TResult:
-            func_self: TOwner = kwargs.pop("self") if "self" in kwargs else owner  # type: ignore[assignment]
-            if func_self is None:
-                raise RuntimeError("Missing self argument.")
-
-            return await func(func_self, *args, **kwargs)
-
-        return do
-
-    @classmethod
-    def async_generator(
-        cls,
-        func: Callable[
-            Concatenate[TOwner, TParams],
-            AsyncGenerator[TResult, None],
-        ],
-        owner: TOwner | None,
-    ) -> Callable[TParams, AsyncGenerator[TResult, None]]:
-        """
-        Wrapper for asynchronous generator methods.
+    # The wrapper must be a generator function itself, because FastAPI identifies
+    # generator dependencies with `inspect.isgeneratorfunction()`.
+    def do(*args: TParams.args, **kwargs: TParams.kwargs) -> Generator[TResult, None, None]:
+        func_self: TOwner | None = kwargs.pop("self", None)  # type: ignore[assignment]
+        if func_self is None:
+            raise RuntimeError("Missing self argument.")
 
-        Arguments:
-            func: The function to wrap.
-            owner: An optional owner object.
+        yield from func(func_self, *args, **kwargs)
 
-        Returns:
-            The wrapper.
-        """
+    return _copy_meta(do, func)
 
-        @wraps(func)
-        async def do(*args: TParams.args, **kwargs: TParams.kwargs) -> AsyncGenerator[TResult, None]:
-            func_self: TOwner = kwargs.pop("self") if "self" in kwargs else owner  # type: ignore[assignment]
-            if func_self is None:
-                raise RuntimeError("Missing self argument.")
 
-            async for res in func(func_self, *args, **kwargs):
-                yield res
+def _wrap_async_method(
+    func: Callable[Concatenate[TOwner, TParams], Coroutine[None, None, TResult]],
+    owner: TOwner | None,
+) -> Callable[TParams, Coroutine[None, None, TResult]]:
+    """
+    Wrapper for asynchronous methods.
 
-        return do
+    Arguments:
+        func: The function to wrap.
+        owner: An optional owner object.
+
+    Returns:
+        The wrapper.
+    """
+    if owner is not None:
+        return _bind_owner(func, owner)
+
+    async def do(*args: TParams.args, **kwargs: TParams.kwargs) -> TResult:
+        func_self: TOwner | None = kwargs.pop("self", None)  # type: ignore[assignment]
+        if func_self is None:
+            raise RuntimeError("Missing self argument.")
+
+        return await func(func_self, *args, **kwargs)
+
+    return _copy_meta(do, func)
+
+
+def _wrap_async_generator(
+    func: Callable[
+        Concatenate[TOwner, TParams],
+        AsyncGenerator[TResult, None],
+    ],
+    owner: TOwner | None,
+) -> Callable[TParams, AsyncGenerator[TResult, None]]:
+    """
+    Wrapper for asynchronous generator methods.
+
+    Arguments:
+        func: The function to wrap.
+        owner: An optional owner object.
+
+    Returns:
+        The wrapper.
+    """
+    if owner is not None:
+        return _bind_owner(func, owner)
+
+    # The wrapper must be an async generator function itself, because FastAPI identifies
+    # async generator dependencies with `inspect.isasyncgenfunction()`.
+    async def do(*args: TParams.args, **kwargs: TParams.kwargs) -> AsyncGenerator[TResult, None]:
+        func_self: TOwner | None = kwargs.pop("self", None)  # type: ignore[assignment]
+        if func_self is None:
+            raise RuntimeError("Missing self argument.")
+
+        async for res in func(func_self, *args, **kwargs):
+            yield res
+
+    return _copy_meta(do, func)
+
+
+class SelfWrapper:
+    """
+    `SelfDependent` function wrappers that populate the `self` argument of the wrapped function
+    from the keyword arguments if no owner instance was provided, or bind the owner instance
+    as `self` if one was provided. Thus the wrapped "static" methods can behave as if they were
+    instance methods.
+
+    Wrappers with an owner are `functools.partial` objects, so they behave like bound methods.
+
+    The wrapper factories are module-level functions, this class only groups them.
+    """
+
+    sync_method = staticmethod(_wrap_sync_method)
+    sync_generator = staticmethod(_wrap_sync_generator)
+    async_method = staticmethod(_wrap_async_method)
+    async_generator = staticmethod(_wrap_async_generator)
 
 
 class SelfDependent(Generic[TOwner, TParams, TResult]):
@@ -137,7 +194,19 @@ class SelfDependent(Generic[TOwner, TParams, TResult]):
     `self` argument that can be processed and used by FastAPI as a dependency.
     """
 
-    __slots__ = ("_wrapped", "_factory", "_memo")
+    __slots__ = (
+        "_wrapped",
+        "_factory_depends",
+        "_owner_cls",
+        "_unbound_value",
+        "_cached",
+        "_memo",
+        "_other_params",
+        "_return_annotation",
+        "_bound_signature",
+        "_unbound_signature",
+        "_wrapper_factory",
+    )
 
     def __init__(
         self,
@@ -151,38 +220,136 @@ class SelfDependent(Generic[TOwner, TParams, TResult]):
         Arguments:
             wrapped: The wrapped function.
             factory: An optional factory for creating `self` instances.
+
+        Raises:
+            ValueError: If `wrapped` has no `self` argument, or if `factory` is set even though
+                the `self` argument of `wrapped` is already annotated as a dependency.
         """
         self._wrapped = wrapped
-        self._factory = factory
-        self._memo = IdMemo[Callable[TParams, TResult]]()
+        self._factory_depends = None if factory is None else Depends(factory)
+        self._owner_cls: type[TOwner] | None = None
+        self._unbound_value: Callable[TParams, TResult] | None = None
+        # (owner id, owner type id, value) of the most recent access, stored as a single
+        # tuple so concurrent readers always see a consistent entry.
+        self._cached: tuple[int, int, Callable[TParams, TResult]] | None = None
+        self._memo: IdMemo[Callable[TParams, TResult]] = IdMemo()
+        signature = get_self_signature(wrapped)
+        self._other_params = tuple(v for k, v in signature.parameters.items() if k != "self")
+        self._return_annotation = signature.return_annotation
+        self._bound_signature = inspect.Signature(
+            self._other_params, return_annotation=self._return_annotation
+        )
+        # If self is already annotated as a dependency, the signature can be used as is.
+        self._unbound_signature = (
+            signature if is_dependency_annotation(signature.parameters["self"].annotation) else None
+        )
+        if self._unbound_signature is not None and factory is not None:
+            raise ValueError("Factory is not allowed if self is already annotated as a dependency.")
+
+        self._wrapper_factory = self._select_wrapper_factory(wrapped)
+
+    def __set_name__(self, owner_cls: type[TOwner], name: str) -> None:
+        # Create the value for the typical `Depends(OwnerClass.method)` use-case in advance.
+        self._owner_cls = owner_cls
+        self._unbound_value = self._create(None, owner_cls)
 
     def __get__(self, owner: TOwner | None, obj_type: type[TOwner]) -> Callable[TParams, TResult]:
-        memo = self._memo
-        hcurrent = memo.hash(owner, obj_type)
-        if hcurrent in memo:
-            return self._memo.value
+        if owner is None and obj_type is self._owner_cls:
+            return self._unbound_value  # type: ignore[return-value]
+
+        # Fast path: the same (owner, obj_type) pair as in the previous call.
+        owner_id, type_id = id(owner), id(obj_type)
+        cached = self._cached
+        if cached is not None and cached[0] == owner_id and cached[1] == type_id:
+            return cached[2]
+
+        if owner is None:
+            # Class-level access through a subclass. The created value either references
+            # obj_type (with the generated annotation of the self argument), so an id can not
+            # be reused while it's cached, or it uses the pre-annotated signature of the wrapped
+            # method, which doesn't depend on obj_type at all.
+            memo = self._memo
+            key = (owner_id, type_id)
+            result = memo.get(key)
+            if result is None:
+                result = memo.store(key, self._create(owner, obj_type))
+        else:
+            # Binding an owner is cheap, and caching the bound values would keep owners alive.
+            result = self._create(owner, obj_type)
+
+        self._cached = (owner_id, type_id, result)
+        return result
+
+    def _create(self, owner: TOwner | None, obj_type: type[TOwner]) -> Callable[TParams, TResult]:
+        """
+        Creates the descriptor value for the given owner and owner type.
+
+        Arguments:
+            owner: The optional owner instance.
+            obj_type: The owner type.
+        """
+        result: Callable[TParams, TResult] = self._wrapper_factory(self._wrapped, owner)
+        if owner is not None:
+            result.__signature__ = self._bound_signature  # type: ignore[attr-defined]
+        elif self._unbound_signature is not None:
+            result.__signature__ = self._unbound_signature  # type: ignore[attr-defined]
+        else:
+            result.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+                (self._get_self_param(obj_type), *self._other_params),
+                return_annotation=self._return_annotation,
+            )
+
+        return result
+
+    def _get_self_param(self, obj_type: type[TOwner]) -> inspect.Parameter:
+        """
+        Returns the annotated `self` parameter description for the given owner type.
+
+        Arguments:
+            obj_type: The owner type.
+        """
+        depends = Depends(obj_type) if self._factory_depends is None else self._factory_depends
+        return inspect.Parameter(
+            "self",
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            annotation=Annotated[obj_type, depends],
+        )
+
+    @staticmethod
+    def _select_wrapper_factory(
+        wrapped: Callable[..., Any],
+    ) -> Callable[[Callable[..., Any], Any], Callable[..., Any]]:
+        """
+        Selects the wrapper factory that matches the type of the wrapped function.
+
+        Arguments:
+            wrapped: The wrapped function.
+
+        Returns:
+            The wrapper factory to use for `wrapped`.
+        """
+        code = getattr(wrapped, "__code__", None)
+        if code is not None:
+            # Python function, read the code flags directly.
+            flags = code.co_flags
+            if flags & inspect.CO_GENERATOR:
+                return _wrap_sync_generator
+            elif flags & inspect.CO_ASYNC_GENERATOR:
+                return _wrap_async_generator
+            elif flags & inspect.CO_COROUTINE or asyncio.iscoroutinefunction(wrapped):
+                # Sync functions can also be marked as coroutine functions since Python 3.12.
+                return _wrap_async_method
+            else:
+                return _wrap_sync_method
 
-        result: Callable[TParams, TResult]
-        wrapped = self._wrapped
         if inspect.isgeneratorfunction(wrapped):
-            result = SelfWrapper.sync_generator(wrapped, owner)  # type: ignore[assignment]
+            return _wrap_sync_generator
         elif inspect.isasyncgenfunction(wrapped):
-            result = SelfWrapper.async_generator(wrapped, owner)  # type: ignore[assignment]
+            return _wrap_async_generator
         elif asyncio.iscoroutinefunction(wrapped):
-            result = SelfWrapper.async_method(wrapped, owner)  # type: ignore[assignment]
+            return _wrap_async_method
         else:
-            result = SelfWrapper.sync_method(wrapped, owner)
-
-        replace_self_signature(
-            result,
-            inspect.Parameter(
-                "self",
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                annotation=Annotated[obj_type, Depends(self._factory or obj_type)],
-            ),
-        )
-
-        return self._memo.store(hcurrent, result)
+            return _wrap_sync_method
 
 
 @overload
@@ -206,6 +373,9 @@ def selfdependent(
     """
     Decorator that converts an instance method into a FastAPI dependency using a `SelfDependent` descriptor.
 
+    If the `self` argument of the decorated method is already annotated as a FastAPI dependency
+    (`Annotated[..., Depends(...)]`), then that annotation is used as is and `factory` must not be set.
+
     Arguments:
         factory: An optional factory (and FastAPI dependency) that can be wrapped in `Depends()`
             and that produces the `self` argument for the wrapped method.
@@ -214,7 +384,7 @@ def selfdependent(
     def decorator(
         func: Callable[Concatenate[TOwner, TParams], TResult],
     ) -> SelfDependent[TOwner, TParams, TResult]:
-        return SelfDependent[TOwner, TParams, TResult](wrapped=func, factory=factory)
+        return SelfDependent(wrapped=func, factory=factory)
 
     # This type ignore is necessary for mypy in case the decorated method is overridden in a subclass.
     return decorator  # type: ignore
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from collections.abc import AsyncGenerator, Callable, Generator
 from typing import Any, Concatenate, Coroutine, ParamSpec, Protocol, TypeVar
 
@@ -6,6 +8,7 @@ Tcov = TypeVar("Tcov", covariant=True)
 TOwner = TypeVar("TOwner")
 TResult = TypeVar("TResult")
 TParams = ParamSpec("TParams")
+TWrapper = TypeVar("TWrapper", bound=Callable[..., Any])
 
 BoundMethod = Callable[Concatenate[TOwner, TParams], TResult]
 
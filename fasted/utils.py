@@ -1,6 +1,8 @@
 import inspect
 from collections.abc import Callable
-from typing import ParamSpec, TypeVar
+from typing import Annotated, Any, ParamSpec, TypeVar, get_origin
+
+from fastapi import params
 
 Tcov = TypeVar("Tcov", covariant=True)
 TOwner = TypeVar("TOwner")
@@ -8,6 +10,38 @@ TResult = TypeVar("TResult")
 TParams = ParamSpec("TParams")
 
 
+def is_dependency_annotation(annotation: Any) -> bool:
+    """
+    Returns whether the given annotation is an `Annotated` type with `Depends()` metadata.
+
+    Arguments:
+        annotation: The annotation to check.
+    """
+    return get_origin(annotation) is Annotated and any(
+        isinstance(m, params.Depends) for m in annotation.__metadata__
+    )
+
+
+def get_self_signature(func: Callable[..., object]) -> inspect.Signature:
+    """
+    Returns the signature of `func`, making sure it has a `self` argument.
+
+    Arguments:
+        func: The function whose signature should be returned.
+
+    Returns:
+        The signature of `func`.
+
+    Raises:
+        ValueError: If `func` has no `self` argument.
+    """
+    signature = inspect.signature(func)
+    if "self" not in signature.parameters:
+        raise ValueError("Method has no self argument.")
+
+    return signature
+
+
 def replace_self_signature(
     func: Callable[TParams, TResult],
     self_param: inspect.Parameter,
@@ -25,10 +59,7 @@ def replace_self_signature(
     Raises:
         ValueError: If `func` has no `self` argument.
     """
-    signature = inspect.signature(func)
-    if "self" not in signature.parameters:
-        raise ValueError("Method has no self argument.")
-
+    signature = get_self_signature(func)
     func.__signature__ = signature.replace(  # type: ignore[attr-defined]
         parameters=(
             self_param,
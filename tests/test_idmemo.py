@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import pytest
+
+from fasted.idmemo import IdMemo
+
+
+def test_idmemo_lru() -> None:
+    memo = IdMemo[str](maxsize=2)
+    a, b, c = object(), object(), object()
+    ka, kb, kc = (id(a), id(int)), (id(b), id(int)), (id(c), id(int))
+
+    assert memo.get(ka) is None
+    assert memo.store(ka, "a") == "a"
+    assert memo.store(kb, "b") == "b"
+    assert memo.get(ka) == "a"  # Makes "b" the least recently used value.
+
+    memo.store(kc, "c")
+    assert ka in memo
+    assert kb not in memo
+    assert memo.get(kc) == "c"
+
+
+def test_idmemo_falsy_value() -> None:
+    memo = IdMemo[int | None]()
+    missing = object()
+    key = (id(None), id(int))
+
+    assert memo.get(key, missing) is missing
+    memo.store(key, None)
+    assert memo.get(key, missing) is None
+
+
+def test_idmemo_evicted_during_get() -> None:
+    class EvictingDict(OrderedDict[Hashable, str]):
+        """Simulates a concurrent `store()` that evicts the key right after it was looked up."""
+
+        def get(self, key: Hashable, default: Any = None) -> Any:
+            value = super().get(key, default)
+            self.pop(key, None)
+            return value
+
+    memo = IdMemo[str]()
+    memo.store(1, "value")
+    memo._cache = EvictingDict(memo._cache)
+    assert memo.get(1) is None
+
+
+def test_idmemo_hash_deprecated() -> None:
+    with pytest.deprecated_call():
+        IdMemo[str]().hash(object(), int)
@@ -1,4 +1,9 @@
-from typing import Annotated, AsyncGenerator, Generator, cast
+import asyncio
+import gc
+import inspect
+import sys
+import weakref
+from typing import Annotated, Any, AsyncGenerator, Coroutine, Generator, cast
 
 import pytest
 from fastapi import Depends, FastAPI
@@ -25,6 +30,10 @@ class Foo(BaseFoo):  # Test inheritence and super() support.
     def factory(self, mul: float | None = None) -> float:
         return self._base if mul is None else (self._base * mul)
 
+    @selfdependent()
+    def annotated_self(self: Annotated[BaseFoo, Depends(make_foo)], mul: float | None = None) -> float:
+        return self._base if mul is None else (self._base * mul)
+
     @selfdependent()
     def sync_method(self, mul: float | None = None) -> float:
         return super().sync_method(mul)
@@ -47,10 +56,12 @@ def app() -> FastAPI:
     app = FastAPI()
 
     DependsFactory = Annotated[float, Depends(Foo.factory)]
+    DependsAnnotatedSelf = Annotated[float, Depends(Foo.annotated_self)]
     DependsSyncMethod = Annotated[float, Depends(Foo.sync_method)]
     DependsAsyncMethod = Annotated[float, Depends(Foo.async_method)]
     DependsSyncGenerator = Annotated[float, Depends(Foo.sync_generator)]
     DependsAsyncGenerator = Annotated[float, Depends(Foo.async_generator)]
+    DependsBoundMethod = Annotated[float, Depends(Foo(5).async_method)]
 
     @app.get("/manual")
     async def manual() -> float:
@@ -69,6 +80,10 @@ def app() -> FastAPI:
     def factory(value: DependsFactory) -> float:
         return value
 
+    @app.get("/annotated-self")
+    def annotated_self(value: DependsAnnotatedSelf) -> float:
+        return value
+
     @app.get("/sync-method")
     def sync_method(value: DependsSyncMethod) -> float:
         return value
@@ -85,6 +100,10 @@ def app() -> FastAPI:
     async def async_generator(value: DependsAsyncGenerator) -> float:
         return value
 
+    @app.get("/bound-method")
+    async def bound_method(value: DependsBoundMethod) -> float:
+        return value
+
     return app
 
 
@@ -113,6 +132,19 @@ def test_factory(client: TestClient, params: dict[str, float], expected: float)
     assert float(response.text) == expected
 
 
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    (
+        ({"base_1": 2, "base_2": 4}, 6),
+        ({"base_1": 2, "base_2": 4, "mul": 7}, 42),
+    ),
+)
+def test_annotated_self(client: TestClient, params: dict[str, float], expected: float) -> None:
+    response = client.get("/annotated-self", params=params)
+    response.raise_for_status()
+    assert float(response.text) == expected
+
+
 @pytest.mark.parametrize(
     ("params", "expected"),
     (
@@ -157,3 +189,91 @@ def test_async_generator(client: TestClient, params: dict[str, float], expected:
     response = client.get("/async-generator", params=params)
     response.raise_for_status()
     assert float(response.text) == expected
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    (
+        ({}, 5),
+        ({"mul": 3}, 15),
+        ({"base": 6, "mul": 3}, 15),  # There's no base query parameter, the bound instance is used.
+    ),
+)
+def test_bound_method(client: TestClient, params: dict[str, float], expected: float) -> None:
+    response = client.get("/bound-method", params=params)
+    response.raise_for_status()
+    assert float(response.text) == expected
+
+
+def test_bound_signature() -> None:
+    foo = Foo(2)
+    assert "self" in inspect.signature(Foo.sync_method).parameters
+    assert "self" not in inspect.signature(foo.sync_method).parameters
+    assert foo.sync_method(mul=3) == 6
+
+
+def test_many_owners() -> None:
+    foos = [Foo(i) for i in range(100)]
+    for _ in range(2):
+        assert [foo.sync_method() for foo in foos] == list(range(100))
+
+
+def test_owners_not_retained() -> None:
+    refs = []
+    for i in range(100):
+        foo = Foo(i)
+        assert foo.sync_method() == i
+        refs.append(weakref.ref(foo))
+        del foo
+
+    gc.collect()
+    # Only the owner of the most recently accessed value may be kept alive.
+    assert sum(ref() is not None for ref in refs) <= 1
+
+
+def test_subclasses_not_retained() -> None:
+    refs = []
+    for i in range(400):
+        sub_foo: type[Foo] = type(f"SubFoo{i}", (Foo,), {})
+        assert "self" in inspect.signature(sub_foo.sync_method).parameters
+        refs.append(weakref.ref(sub_foo))
+        del sub_foo
+
+    gc.collect()
+    # The memo and typing's own (128-item) Annotated cache may keep some subclasses alive,
+    # but their number must be bounded.
+    assert sum(ref() is not None for ref in refs) < 200
+
+
+def test_class_access() -> None:
+    class SubFoo(Foo): ...
+
+    assert Foo.sync_method is Foo.sync_method
+    assert SubFoo.sync_method is not Foo.sync_method
+    assert inspect.signature(SubFoo.sync_method).parameters["self"].annotation.__origin__ is SubFoo
+
+
+def test_annotated_self_with_factory() -> None:
+    def method(self: Annotated[BaseFoo, Depends(make_foo)]) -> float:
+        return self._base
+
+    with pytest.raises(ValueError):
+        selfdependent(factory=make_foo)(method)
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="inspect.markcoroutinefunction() requires Python 3.12"
+)
+def test_marked_coroutine_function() -> None:
+    async def base_value(self: Foo) -> float:
+        return self._base
+
+    def marked(self: Foo) -> Coroutine[None, None, float]:
+        return base_value(self)
+
+    class MarkedFoo(Foo):
+        value = selfdependent()(inspect.markcoroutinefunction(marked))  # type: ignore[attr-defined,unused-ignore]
+
+    value: Any = MarkedFoo.value
+    assert asyncio.iscoroutinefunction(value)
+    assert asyncio.run(value(self=MarkedFoo(4))) == 4